@@ -0,0 +1,32 @@
+import os
+
+import orjson
+
+try:
+    from redis.asyncio import Redis
+except ImportError:  # redis is optional; the cache is a no-op without it
+    Redis = None
+
+REDIS_URL = os.getenv("ABGS_REDIS_URL")
+CACHE_TTL = 60  # seconds
+
+_client = Redis.from_url(REDIS_URL) if Redis and REDIS_URL else None
+
+def _key(user_id, goal_name):
+    return f"checkin:{user_id}:{goal_name}"
+
+async def get_checkin(user_id, goal_name):
+    if _client is None:
+        return None
+    val = await _client.get(_key(user_id, goal_name))
+    return orjson.loads(val) if val is not None else None
+
+async def set_checkin(user_id, goal_name, value):
+    if _client is None:
+        return
+    await _client.setex(_key(user_id, goal_name), CACHE_TTL, orjson.dumps(value))
+
+async def invalidate(user_id, goal_name):
+    if _client is None:
+        return
+    await _client.delete(_key(user_id, goal_name))
@@ -0,0 +1,32 @@
+from sqlalchemy import bindparam, insert, select
+
+from app.models import CheckIn
+
+# Built once at import: repeated executions hit SQLAlchemy's compiled-SQL
+# cache instead of paying statement compilation on every write.
+INSERT_CHECKIN = insert(CheckIn)
+
+# Selects individual columns rather than the CheckIn entity: rows come
+# back as plain tuples with no ORM instrumentation or identity-map work,
+# and the ordering rides the (user_id, timestamp) index.
+SELECT_CHECKINS_BY_USER = (
+    select(
+        CheckIn.id,
+        CheckIn.user_id,
+        CheckIn.goal_name,
+        CheckIn.status,
+        CheckIn.timestamp,
+    )
+    .where(CheckIn.user_id == bindparam("user_id"))
+    .order_by(CheckIn.timestamp.desc())
+)
+
+SELECT_LATEST_STATUS = (
+    select(CheckIn.status, CheckIn.timestamp)
+    .where(
+        CheckIn.user_id == bindparam("user_id"),
+        CheckIn.goal_name == bindparam("goal_name"),
+    )
+    .order_by(CheckIn.timestamp.desc())
+    .limit(1)
+)
@@ -1,13 +1,62 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./abgs.db"  # local DB
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./abgs.db"  # local DB
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
+
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    # Explicit pool sizing: the default 5+10 collapses under FastAPI
+    # concurrency. pre_ping/recycle drop connections killed by LB or
+    # proxy idle timeouts instead of handing them to requests.
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # Batch bulk INSERTs into multi-valued statements of up to 1000 rows.
+    insertmanyvalues_page_size=1000,
+    # Keep the compiled-SQL LRU comfortably above the statement count so
+    # hot statements never recompile.
+    query_cache_size=1200,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@event.listens_for(engine.sync_engine, "connect")
+def _sqlite_pragmas(dbapi_conn, _):
+    # SQLite defaults to journal_mode=DELETE + synchronous=FULL, which
+    # fsyncs twice per commit and blocks readers behind writers. WAL turns
+    # a commit into an append plus one fsync.
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=268435456")
+    cur.close()
+
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+class Base(DeclarativeBase):
+    pass
+
+async def get_session():
+    async with SessionLocal() as session:
+        yield session
+
+async def get_conn(request: Request):
+    # One pool checkout per request: every query in the handler reuses the
+    # same connection instead of taking the pool lock per statement. Also
+    # stashed on request.state for middleware/background use.
+    async with engine.connect() as conn:
+        request.state.db = conn
+        yield conn
 
-Base = declarative_base()
\ No newline at end of file
+def create_all():
+    # One-shot dev helper. Runs the DDL over a short-lived sync engine so
+    # it works outside (or inside) the event loop.
+    sync_engine = create_engine(SQLALCHEMY_DATABASE_URL.replace("+aiosqlite", ""))
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
@@ -1,16 +1,75 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers
+
+from app.database import MAX_OVERFLOW, POOL_SIZE, create_all, engine
+from app.models import CheckIn
+from app.routes import router
 
-app = FastAPI(title="ABGS - Behavior Adaptive Goal System")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The engine itself is lazy (no connection until first use), so the
+    # only startup DB work is the opt-in dev schema create. Running it
+    # here keeps each worker's boot free of DB I/O until after fork, and
+    # guarantees pooled connections are closed on shutdown.
+    if os.getenv("ABGS_AUTOCREATE") == "1":
+        create_all()
+    # Warm the lazy one-time costs here, behind the readiness gate, so the
+    # first real request doesn't pay them: mapper configuration, one
+    # pooled connection plus a compiled-query cache entry, and the
+    # OpenAPI/Pydantic schema build.
+    configure_mappers()
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(select(CheckIn).limit(0))
+    except SQLAlchemyError:
+        # Schema not created yet (fresh checkout before migration); the
+        # warm-up is best-effort.
+        pass
+    app.openapi()
+    yield
+    await engine.dispose()
+
+app = FastAPI(
+    title="ABGS - Behavior Adaptive Goal System",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Compress only bodies worth compressing: below 512 bytes (the probe
+# responses) the zlib stream setup costs more than the bytes it saves.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+# Probe endpoints get hammered by load balancers; serialize their bodies
+# once at import instead of running Pydantic + json.dumps per request.
+_ROOT = ORJSONResponse({"message": "ABGS running"})
+_HEALTH = ORJSONResponse({"status": "ok"}, headers={"Cache-Control": "max-age=1"})
 
 @app.get("/")
-def root():
-    return {"message": "ABGS running"}
+async def root():
+    return _ROOT
 
 @app.get("/health")
-def health():
-    return {"status": "ok"}
+async def health():
+    # Pure process liveness: never touches the DB, so probes add zero
+    # pool pressure.
+    return _HEALTH
 
-from app.database import Base, engine
-from app.models import CheckIn
+@app.get("/ready")
+async def ready():
+    # Readiness reads pool accounting instead of issuing SELECT 1, so the
+    # probe itself costs no DB round-trip. Report not-ready when nearly
+    # every connection (pool + overflow, minus headroom for the probe's
+    # peers) is checked out.
+    if engine.pool.checkedout() >= POOL_SIZE + MAX_OVERFLOW - 2:
+        return ORJSONResponse({"status": "saturated"}, status_code=503)
+    return ORJSONResponse({"status": "ready"})
 
-Base.metadata.create_all(bind=engine)
\ No newline at end of file
+app.include_router(router)
@@ -1,12 +1,50 @@
-from sqlalchemy import Column, Integer, String, DateTime
-from app.database import Base
 from datetime import datetime
 
-class CheckIn(Base):
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String
+from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+# MappedAsDataclass skips the legacy instrumented __init__ and keeps
+# per-instance overhead down when hydrating large result sets.
+class CheckIn(MappedAsDataclass, Base):
     __tablename__ = "checkins"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, index=True)
-    goal_name = Column(String, index=True)
-    status = Column(String)  # "completed" or "missed"
-    timestamp = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    # No index=True: the primary key is already indexed, and a duplicate
+    # btree just doubles write-side index maintenance. BigInteger avoids a
+    # 32-bit overflow migration later; SQLite needs plain INTEGER to keep
+    # rowid autoincrement in dev.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True),
+        primary_key=True,
+        init=False,
+    )
+    user_id: Mapped[int]
+    goal_name: Mapped[str] = mapped_column(String)
+    status: Mapped[str] = mapped_column(String)  # "completed" or "missed"
+    # Stamped by the database: no per-INSERT Python callable or naive
+    # datetime allocation, and the value is timezone-aware.
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), init=False
+    )
+
+    # Composite indexes match the real access paths ("last N check-ins for
+    # user", "user's history for one goal") with a single range scan that
+    # comes back pre-sorted. The single-column indexes they replace would
+    # only add write amplification.
+    # The postgresql_ kwarg is ignored by SQLite, so dev is unaffected.
+    # On Postgres, queries over recent check-ins then touch only the hot
+    # monthly partition; partitions are pre-created by migration (note:
+    # partitioned PG tables need timestamp added to the PK, which the
+    # migration handles — Identity covers uniqueness within a partition).
+    __table_args__ = (
+        Index("ix_checkins_user_ts", "user_id", "timestamp"),
+        Index("ix_checkins_user_goal", "user_id", "goal_name"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
+
+    # Fetch server-generated defaults with the INSERT itself so batched
+    # inserts don't fall back to row-at-a-time round-trips.
+    __mapper_args__ = {"eager_defaults": True}
@@ -0,0 +1,66 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import cache
+from app.crud import INSERT_CHECKIN, SELECT_CHECKINS_BY_USER, SELECT_LATEST_STATUS
+from app.database import get_session
+
+router = APIRouter()
+
+class CheckInCreate(BaseModel):
+    user_id: int
+    goal_name: str
+    status: str  # "completed" or "missed"
+
+@router.post("/checkins/bulk", status_code=201)
+async def create_checkins_bulk(
+    checkins: List[CheckInCreate],
+    session: AsyncSession = Depends(get_session),
+):
+    # An empty parameter list would degrade to INSERT ... DEFAULT VALUES
+    # and trip the NOT NULL constraints.
+    if not checkins:
+        return {"inserted": 0}
+    # Executing one insert() with a list of dicts routes through
+    # insertmanyvalues: one multi-valued INSERT per page instead of one
+    # round-trip per row.
+    await session.execute(INSERT_CHECKIN, [c.model_dump() for c in checkins])
+    await session.commit()
+    for user_id, goal_name in {(c.user_id, c.goal_name) for c in checkins}:
+        await cache.invalidate(user_id, goal_name)
+    return {"inserted": len(checkins)}
+
+@router.get("/checkins/status")
+async def checkin_status(
+    user_id: int,
+    goal_name: str,
+    session: AsyncSession = Depends(get_session),
+):
+    # Read-through cache: (user_id, goal_name) reads are small, highly
+    # repetitive, and invalidated by the bulk write path above.
+    value = await cache.get_checkin(user_id, goal_name)
+    if value is None:
+        row = (
+            await session.execute(
+                SELECT_LATEST_STATUS, {"user_id": user_id, "goal_name": goal_name}
+            )
+        ).mappings().first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="no check-ins for this goal")
+        value = dict(row)
+        await cache.set_checkin(user_id, goal_name, value)
+    return ORJSONResponse(value)
+
+@router.get("/checkins")
+async def list_checkins(
+    user_id: int,
+    session: AsyncSession = Depends(get_session),
+):
+    # Column select + mappings(): no per-row ORM objects, and orjson
+    # serializes the dicts (datetimes included) straight to bytes.
+    result = await session.execute(SELECT_CHECKINS_BY_USER, {"user_id": user_id})
+    return ORJSONResponse([dict(row) for row in result.mappings()])